@@ -1,23 +1,56 @@
 import os
+import json
+import re
+from hashlib import blake2b
 import subprocess
 from abc import ABC, abstractmethod
 import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 import typer
 import platform
 import bpy
+import bmesh
 import tempfile
-import markdown
 from .utils.dmgextractor import DMGExtractor
-import fitz  # PyMuPDF
-from pygments.formatters import HtmlFormatter
-from markdown.extensions.codehilite import CodeHiliteExtension
+from .utils.fileutils import write_text_atomic
+from .render import render_sections, section_digest
 import math
-from mathutils import Euler, Vector
+from mathutils import Euler, Matrix, Vector
 from urllib.parse import urlparse
-from PIL import Image
-import io
+from email.utils import formatdate
+
+
+def download_file(url, dst, session=requests, headers=None):
+    """Stream url to dst in 1 MiB chunks instead of buffering the whole body.
+
+    The body goes to a uniquely named .part file that is renamed into place once
+    complete, so an interrupted download never leaves a truncated dst behind.
+    Returns the response headers, or None if the server answered 304 Not
+    Modified and dst was left untouched.
+    """
+    dst = Path(dst)
+    with session.get(url, stream=True, timeout=30, headers=headers) as response:
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        response.raw.decode_content = True
+        # a unique .part per call, so concurrent downloads never share one
+        with tempfile.NamedTemporaryFile(
+            dir=dst.parent, prefix=dst.name + ".", suffix=".part", delete=False
+        ) as f:
+            part_path = Path(f.name)
+            try:
+                shutil.copyfileobj(response.raw, f, 1024 * 1024)
+            except BaseException:
+                f.close()
+                part_path.unlink(missing_ok=True)
+                raise
+    part_path.replace(dst)
+    return response.headers
 
 
 class InkscapeInstallerFactory:
@@ -40,7 +73,11 @@ class InkscapeInstaller(ABC):
 
     def is_installed(self):
         """Check if Inkscape is already installed."""
-        return self.install_path.exists()
+        return bool(
+            (self.install_path / ".installed").exists()
+            and self.binary
+            and Path(self.binary).exists()
+        )
 
     @abstractmethod
     def install(self):
@@ -49,35 +86,40 @@ class InkscapeInstaller(ABC):
 
 
 class WindowsInkscapeInstaller(InkscapeInstaller):
+    def __init__(self):
+        super().__init__()
+        self.binary = self.install_path / "inkscape/bin/inkscape.exe"
+
     def install(self):
         # Implementing Windows-specific installation logic
         inkscape_url = "https://inkscape.org/gallery/item/44622/inkscape-1.3.2_2023-11-25_091e20e-x64.7z"
         inkscape_path = self.install_path
+        inkscape_path.mkdir(parents=True, exist_ok=True)
 
         # Download Inkscape
         print("Downloading Inkscape for Windows...")
-        response = requests.get(inkscape_url, stream=True)
-        if response.status_code == 200:
-            with open(inkscape_path / "inkscape.7z", "wb") as f:
-                f.write(response.content)
-            print("Download completed.")
-
-            # Extracting Inkscape
-            print("Extracting Inkscape...")
-            # Note: Use appropriate tool or library to extract .7z files
-            # Example: using subprocess to call a tool like 7zip
-            subprocess.run(
-                [
-                    "7z",
-                    "x",
-                    str(inkscape_path / "inkscape.7z"),
-                    "-o" + str(inkscape_path),
-                ],
-                check=True,
-            )
-            print("Inkscape installed successfully.")
-        else:
+        try:
+            download_file(inkscape_url, inkscape_path / "inkscape.7z")
+        except requests.exceptions.RequestException:
             print("Failed to download Inkscape.")
+            return
+        print("Download completed.")
+
+        # Extracting Inkscape
+        print("Extracting Inkscape...")
+        # Note: Use appropriate tool or library to extract .7z files
+        # Example: using subprocess to call a tool like 7zip
+        subprocess.run(
+            [
+                "7z",
+                "x",
+                str(inkscape_path / "inkscape.7z"),
+                "-o" + str(inkscape_path),
+            ],
+            check=True,
+        )
+        (self.install_path / ".installed").write_text(inkscape_url)
+        print("Inkscape installed successfully.")
 
 
 class MacOSInkscapeInstaller(InkscapeInstaller):
@@ -95,159 +137,180 @@ class MacOSInkscapeInstaller(InkscapeInstaller):
 
         # Download Inkscape
         print("Downloading Inkscape for MacOS...")
-        response = requests.get(inkscape_url, stream=True)
-        if response.status_code == 200:
-            dmg_path = download_path / "Inkscape.dmg"
-            with open(dmg_path, "wb") as f:
-                f.write(response.content)
-            print("Download completed.")
-
-            # Mounting and installing Inkscape
-            print("Installing Inkscape...")
-            with DMGExtractor(dmg_path) as extractor:
-                extractor.extractall(self.install_path)
-
-        else:
+        dmg_path = download_path / "Inkscape.dmg"
+        try:
+            download_file(inkscape_url, dmg_path)
+        except requests.exceptions.RequestException:
             print("Failed to download Inkscape.")
+            return
+        print("Download completed.")
+
+        # Mounting and installing Inkscape
+        print("Installing Inkscape...")
+        with DMGExtractor(dmg_path) as extractor:
+            extractor.extractall(self.install_path)
+        (self.install_path / ".installed").write_text(inkscape_url)
 
 
 class LinuxInkscapeInstaller(InkscapeInstaller):
+    def __init__(self):
+        super().__init__()
+        self.binary = self.install_path / "bin/inkscape"
+
     def install(self):
         # Implementing Linux-specific installation logic
         inkscape_url = "https://inkscape.org/gallery/item/44615/inkscape-1.3.2.tar.xz"
         home_path = str(Path.home())
         source_path = Path(home_path) / "inkscape_source"
+        source_path.mkdir(parents=True, exist_ok=True)
         install_path = self.install_path
 
         # Download Inkscape
         print("Downloading Inkscape for Linux...")
-        response = requests.get(inkscape_url, stream=True)
-        if response.status_code == 200:
-            with open(source_path / "inkscape.tar.xz", "wb") as f:
-                f.write(response.content)
-            print("Download completed.")
-
-            # Extracting and installing Inkscape
-            print("Installing Inkscape...")
-            subprocess.run(
-                [
-                    "tar",
-                    "-xf",
-                    str(source_path / "inkscape.tar.xz"),
-                    "-C",
-                    str(source_path),
-                ],
-                check=True,
-            )
-            build_path = source_path / "build"
-            os.makedirs(build_path, exist_ok=True)
-            os.chdir(build_path)
-            subprocess.run(
-                ["cmake", "..", "-DCMAKE_INSTALL_PREFIX=" + str(install_path)],
-                check=True,
-            )
-            subprocess.run(["make"], check=True)
-            subprocess.run(["make", "install"], check=True)
-            print("Inkscape installed successfully.")
-        else:
+        try:
+            download_file(inkscape_url, source_path / "inkscape.tar.xz")
+        except requests.exceptions.RequestException:
             print("Failed to download Inkscape.")
+            return
+        print("Download completed.")
+
+        # Extracting and installing Inkscape
+        print("Installing Inkscape...")
+        subprocess.run(
+            [
+                "tar",
+                "-xf",
+                str(source_path / "inkscape.tar.xz"),
+                "-C",
+                str(source_path),
+            ],
+            check=True,
+        )
+        build_path = source_path / "build"
+        os.makedirs(build_path, exist_ok=True)
+        os.chdir(build_path)
+        subprocess.run(
+            ["cmake", "..", "-DCMAKE_INSTALL_PREFIX=" + str(install_path)],
+            check=True,
+        )
+        subprocess.run(["make"], check=True)
+        subprocess.run(["make", "install"], check=True)
+        (self.install_path / ".installed").write_text(inkscape_url)
+        print("Inkscape installed successfully.")
 
 
-class InkscapeInstallerFactory:
-    @staticmethod
-    def get_installer():
-        if platform.system() == "Windows":
-            return WindowsInkscapeInstaller()
-        elif platform.system() == "Darwin":  # macOS
-            return MacOSInkscapeInstaller()
-        elif platform.system() == "Linux":
-            return LinuxInkscapeInstaller()
-        else:
-            raise NotImplementedError("Unsupported operating system")
+# markdown image syntax: ![alt](link)
+IMG_RE = re.compile(r"!\[[^\]]*\]\(([^)]+)\)")
 
 
-class InkscapeInstaller(ABC):
-    def __init__(self):
-        self.install_path = Path.home() / ".md3d/inkscape"
-        self.binary = None
-        self.install_path.mkdir(parents=True, exist_ok=True)
+def image_cache_path(base_dir, link):
+    """On-disk copy of a remote image, unique per URL.
 
-    @abstractmethod
-    def install(self):
-        """Install Inkscape."""
-        pass
+    The URL's basename alone isn't enough: different hosts or query strings can
+    share it, so a short hash of the full URL is added before the suffix.
+    """
+    name = Path(urlparse(link).path).name
+    digest = blake2b(link.encode(), digest_size=8).hexdigest()
+    return base_dir / f"{Path(name).stem}_{digest}{Path(name).suffix}"
 
-    def is_installed(self):
-        """Check if Inkscape is already installed."""
-        return self.install_path.exists()
 
+def image_meta_path(img_path):
+    """Sidecar file holding the ETag/Last-Modified of a downloaded image."""
+    return img_path.with_name(img_path.name + ".meta")
 
-class CustomHtmlFormatter(HtmlFormatter):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+
+def conditional_headers(img_path):
+    """Build If-None-Match/If-Modified-Since headers for a cached image."""
+    if not (img_path.exists() and img_path.stat().st_size > 0):
+        return {}
+    meta_path = image_meta_path(img_path)
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        # a missing or truncated sidecar just means no ETag to revalidate with
+        meta = {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    # fall back to the file's mtime for images cached before the sidecar existed
+    headers["If-Modified-Since"] = meta.get("last_modified") or formatdate(
+        img_path.stat().st_mtime, usegmt=True
+    )
+    return headers
 
 
 def download_images_from_markdown(md_content, base_dir):
     slide_images = {}
     image_links = {}
     sections = md_content.split("---")
-    processed_md = ""
 
     for i, section in enumerate(sections):
-        lines = section.split("\n")
         print(f"section {i} {section}")
-        image_link = None
+        # each slide shows a single image; the last one in the section wins
+        links = IMG_RE.findall(section)
+        image_links[i] = links[-1] if links else None
 
-        for line in lines:
-            print(f"section {i}: {line}")
-
-            if line.startswith("![") and "](" in line and line.endswith(")"):
-                link_start = line.find("](") + 2
-                link_end = line.find(")", link_start)
-                print(f"found image link: {line[link_start:link_end]}")
-                image_link = line[link_start:link_end]
-
-                # remove the image link from the line
-                lines.remove(line)
-        if image_link:
-            image_links[i] = image_link
-        else:
-            image_links[i] = None
-        processed_md += "\n".join(lines)
-        if i < len(sections) - 1:
-            processed_md += "---"
-
-        print(f"Image links: {image_links}")
+    print(f"Image links: {image_links}")
 
     image_paths = []
+    # map each remote URL to its on-disk copy
+    url_paths = {
+        link: image_cache_path(base_dir, link)
+        for link in image_links.values()
+        if link and link.startswith("http")
+    }
+    if url_paths:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        def fetch(link):
+            # cached images are revalidated; a 304 keeps the copy on disk
+            img_path = url_paths[link]
+            headers = conditional_headers(img_path)
+            try:
+                response_headers = download_file(
+                    link, img_path, session=session, headers=headers
+                )
+            except requests.exceptions.RequestException as e:
+                if not headers:
+                    raise
+                # keep using the cached copy when it can't be revalidated
+                print(f"Using cached image for {link}: {e}")
+                return link
+            if response_headers is not None:
+                meta = {
+                    "etag": response_headers.get("ETag"),
+                    "last_modified": response_headers.get("Last-Modified"),
+                }
+                write_text_atomic(image_meta_path(img_path), json.dumps(meta))
+            return link
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(fetch, url_paths))
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Error downloading image: {e}") from e
+        finally:
+            session.close()
+
     for i, link in enumerate(image_links.values()):
         print(f"i {i}, {link}")
         img_path = None
-        if link and link.startswith("http"):
-            try:
-                response = requests.get(link)
-                if response.status_code == 200:
-                    img_data = response.content
-                    img_name = os.path.basename(urlparse(link).path)
-                    img_path = base_dir / img_name
-            except requests.exceptions as e:
-                raise (f"Error downloading image: {e}")
+        if link in url_paths:
+            img_path = url_paths[link]
         elif link:
-            try:
-                img_path = Path(link)
-                img_name = img_path.name
-                img_data = img_path.read_bytes()
-            except FileNotFoundError as e:
-                raise (f"Error reading image: {e}")
-        if img_path:
-            with open(img_path, "wb") as f:
-                f.write(img_data)
+            # local images are used in place, no need to copy them
+            img_path = Path(link)
+            if not img_path.exists():
+                raise FileNotFoundError(f"Error reading image: {img_path}")
 
         slide_images[i] = str(img_path) if img_path else None
 
     print(f"Image paths: {image_paths}")
 
-    cleaned_md_content = processed_md
+    cleaned_md_content = IMG_RE.sub("", md_content)
     print(f"Cleaned MD content: {cleaned_md_content}")
 
     return slide_images, cleaned_md_content
@@ -305,6 +368,50 @@ def move_to_collection(obj, collection_name):
     bpy.data.collections["Collection"].objects.unlink(obj)
 
 
+# materials already built for an image path
+_mat_cache: dict[str, bpy.types.Material] = {}
+
+# prototype materials; copying one is cheaper than rebuilding its node graph
+_material_proto = None
+_image_proto = None
+
+
+def get_material_proto():
+    """Return the shared node-based material that new materials are copied from."""
+    global _material_proto
+    if _material_proto is None:
+        _material_proto = bpy.data.materials.new(name="MaterialProto")
+        _material_proto.use_nodes = True
+    return _material_proto
+
+
+def get_image_proto():
+    """Return the shared image-textured material that image planes are copied from."""
+    global _image_proto
+    if _image_proto is None:
+        _image_proto = get_material_proto().copy()
+        _image_proto.name = "ImgProto"
+        bsdf = _image_proto.node_tree.nodes["Principled BSDF"]
+        bsdf.inputs["Roughness"].default_value = 1.0
+        bsdf.inputs["Metallic"].default_value = 0.6
+        tex_image = _image_proto.node_tree.nodes.new("ShaderNodeTexImage")
+        _image_proto.node_tree.links.new(
+            bsdf.inputs["Base Color"], tex_image.outputs["Color"]
+        )
+    return _image_proto
+
+
+def release_material_protos():
+    """Remove the prototype materials once every material has been copied."""
+    global _material_proto, _image_proto
+    for proto in (_image_proto, _material_proto):
+        if proto is not None:
+            bpy.data.materials.remove(proto)
+    _material_proto = None
+    _image_proto = None
+    _mat_cache.clear()
+
+
 def import_and_position_images(
     slide_images, offset_x=2.0, offset_y=0.15, offset_z=2.8, text_plane_width=2
 ):
@@ -314,15 +421,14 @@ def import_and_position_images(
         print(f"importing {i}, {img_path}")
         # Load image
         if img_path:
-            with Image.open(img_path) as img:
-                img_data = io.BytesIO()
-                img.save(img_data, format="PNG")
-                img_data.seek(0)
-
             # Create image data block in Blender
             img_name = os.path.basename(img_path)
             blender_img = bpy.data.images.load(img_path, check_existing=True)
-            blender_img.pack()
+            # Blender reports a size of (0, 0) for files it couldn't decode
+            if not (blender_img.size[0] and blender_img.size[1]):
+                raise ValueError(f"Could not read image: {img_path}")
+            if not blender_img.packed_file:
+                blender_img.pack()
 
             # Create a new plane and assign the image as a texture
             bpy.ops.mesh.primitive_plane_add(
@@ -332,7 +438,7 @@ def import_and_position_images(
             plane.rotation_euler[0] = 1.5708  # 90 degrees in radians
 
             # Adjust plane size to match image aspect ratio
-            img_aspect = img.width / img.height
+            img_aspect = blender_img.size[0] / blender_img.size[1]
             plane.scale.x = img_aspect
 
             # Calculate X-coordinate for right alignment
@@ -347,17 +453,13 @@ def import_and_position_images(
             plane.location.y = offset_y
             plane.location.z = offset_z
 
-            # Create material with image texture
-            mat = bpy.data.materials.new(name=img_name + "_Mat")
-            mat.use_nodes = True
-            bsdf = mat.node_tree.nodes["Principled BSDF"]
-            bsdf.inputs["Roughness"].default_value = 1.0
-            bsdf.inputs["Metallic"].default_value = 0.6
-            tex_image = mat.node_tree.nodes.new("ShaderNodeTexImage")
-            tex_image.image = blender_img
-            mat.node_tree.links.new(
-                bsdf.inputs["Base Color"], tex_image.outputs["Color"]
-            )
+            # Create material with image texture, reusing it if the image repeats
+            mat = _mat_cache.get(img_path)
+            if mat is None:
+                mat = get_image_proto().copy()
+                mat.name = img_name + "_Mat"
+                mat.node_tree.nodes["Image Texture"].image = blender_img
+                _mat_cache[img_path] = mat
             plane.data.materials.append(mat)
 
             # create the images collection if it doesn't exist
@@ -376,71 +478,100 @@ def import_and_position_images(
         move_to_collection(light, "Lights")
 
 
-def markdown_to_html(md_text):
-    print("Converting Markdown to HTML...")
-    print(md_text)
-    # Create an instance of HtmlFormatter
-    formatter = CustomHtmlFormatter(
-        style="default"
-    )  # You can change the style as needed
-    css = formatter.get_style_defs(".codehilite")
+def convert_pdfs_to_svgs(pairs):
+    """Convert (input_pdf, output_svg) pairs with a single Inkscape shell process.
 
-    # Create an instance of CodeHiliteExtension with the formatter
-    code_hilite_extension = CodeHiliteExtension(pygments_formatter=formatter)
-    code_hilite_extension = CodeHiliteExtension()
-
-    # Convert Markdown to HTML
-    md_extensions = ["fenced_code", code_hilite_extension]
-    html_content = markdown.markdown(md_text, extensions=md_extensions)
-
-    # Combine CSS and HTML
-    full_html = (
-        f"<html><head><style>{css}</style></head><body>{html_content}</body></html>"
+    Inkscape exports to a temporary name that is only moved into place once the
+    process has finished, so the cache never sees a partial SVG.
+    """
+    if not pairs:
+        return
+    # Inkscape is only needed for this fallback path, so install it lazily
+    if not inkscape.is_installed():
+        inkscape.install()
+    part_svgs = [f"{output_svg}.{os.getpid()}.part.svg" for _, output_svg in pairs]
+    commands = "".join(
+        f"file-open:{input_pdf}; export-type:svg; export-filename:{part_svg}; "
+        "export-do; file-close\n"
+        for (input_pdf, _), part_svg in zip(pairs, part_svgs)
     )
-    with open("test.html", "w") as f:
-        f.write(full_html)
-
-    return full_html
-
-
-def convert_md_to_pdf(md_text, output_pdf):
-    html = markdown_to_html(md_text)
-    doc = fitz.open()
-    page = doc.new_page()
-    rect = fitz.Rect(0, 0, page.rect.width, page.rect.height)
-    page.insert_htmlbox(rect, html)
-    doc.save(output_pdf)
-    doc.close()
-
-
-def convert_pdf_to_svg(input_pdf, output_svg):
+    commands += "quit\n"
     try:
         # For Inkscape 1.0 and later
-        subprocess.run(
-            [
-                str(inkscape.binary),
-                input_pdf,
-                "--export-type=svg",
-                "--export-filename=" + output_svg,
-            ],
-            check=True,
+        process = subprocess.Popen(
+            [str(inkscape.binary), "--shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
         )
-    except subprocess.CalledProcessError as e:
+        process.communicate(commands)
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
+    except (subprocess.CalledProcessError, OSError) as e:
         print("An error occurred: ", e)
 
+    for (_, output_svg), part_svg in zip(pairs, part_svgs):
+        part_path = Path(part_svg)
+        if part_path.exists() and part_path.stat().st_size > 0:
+            part_path.replace(output_svg)
+        else:
+            part_path.unlink(missing_ok=True)
+
 
 def split_markdown(md_content):
     return md_content.split("---")
 
 
 def convert_to_svgs(md_sections, base_dir):
-    svg_filenames = []
-    for i, section in enumerate(md_sections):
-        output_pdf = base_dir / f"section_{i}.pdf"
-        output_svg = base_dir / f"section_{i}.svg"
-        convert_md_to_pdf(section, str(output_pdf))
-        convert_pdf_to_svg(str(output_pdf), str(output_svg))
-        svg_filenames.append(str(output_svg))
+    digests = [section_digest(section) for section in md_sections]
+    svg_filenames = [str(base_dir / f"section_{digest}.svg") for digest in digests]
+
+    # drop cached files of sections that were in the last run but not this one
+    manifest_path = base_dir / "manifest.json"
+    try:
+        old_digests = set(json.loads(manifest_path.read_text()).values())
+    except (OSError, ValueError):
+        old_digests = set()
+    for digest in old_digests - set(digests):
+        for suffix in (".svg", ".pdf"):
+            (base_dir / f"section_{digest}{suffix}").unlink(missing_ok=True)
+
+    # only sections whose SVG isn't cached yet need to be rendered
+    stale = []
+    seen = set()
+    for i, digest in enumerate(digests):
+        if digest in seen or Path(svg_filenames[i]).exists():
+            continue
+        seen.add(digest)
+        stale.append(i)
+
+    pdfs = []
+    workers = min(len(stale), os.cpu_count() or 1)
+    if workers == 1:
+        # not worth starting a pool for a single worker's sections
+        pdfs = render_sections(stale, [md_sections[i] for i in stale], base_dir)
+    elif workers > 1:
+        # one multi-page document per worker rather than one per section;
+        # render_sections lives in md3d.render so workers don't need bpy
+        chunks = [stale[k::workers] for k in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                render_sections,
+                chunks,
+                [[md_sections[i] for i in chunk] for chunk in chunks],
+                repeat(base_dir),
+            )
+            pdfs = [result for chunk in results for result in chunk]
+    # the Inkscape fallback runs after the pool joins
+    convert_pdfs_to_svgs([(pdf, svg_filenames[i]) for i, pdf in pdfs if pdf])
+
+    missing = [svg for svg in svg_filenames if not Path(svg).exists()]
+    if missing:
+        raise RuntimeError(f"Failed to render slides to SVG: {', '.join(missing)}")
+
+    # keep track of which cached SVG belongs to which slide
+    manifest = {str(i): digest for i, digest in enumerate(digests)}
+    write_text_atomic(manifest_path, json.dumps(manifest, indent=2))
     return svg_filenames
 
 
@@ -452,11 +583,10 @@ def create_material(
     transmission=0.0,
 ):
     """Create a material for the slides."""
-    bpy.data.materials.new(name=name)
-
-    bpy.data.materials[name].use_nodes = True
+    mat = get_material_proto().copy()
+    mat.name = name
 
-    bsdf = bpy.data.materials[name].node_tree.nodes["Principled BSDF"]
+    bsdf = mat.node_tree.nodes["Principled BSDF"]
 
     bsdf.inputs["Roughness"].default_value = roughness
     bsdf.inputs["Metallic"].default_value = 0.0
@@ -467,36 +597,48 @@ def create_material(
 
 
 def import_and_transform_svgs(svg_files, offset_x=3):
-    existing_objects = []
-    for obj in bpy.data.objects:
-        existing_objects.append(obj)
+    # build the background plane mesh once, already resized and moved up,
+    # instead of going through bpy.ops and edit mode for every slide
+    plane_mesh = bpy.data.meshes.new("Slide")
+    bm = bmesh.new()
+    bm.loops.layers.uv.new()
+    bmesh.ops.create_grid(
+        bm,
+        x_segments=1,
+        y_segments=1,
+        size=0.5,
+        matrix=Matrix.Translation((0, 2.8, 0)) @ Matrix.Diagonal((2, 1, 1, 1)),
+        calc_uvs=True,
+    )
+    bm.to_mesh(plane_mesh)
+    bm.free()
+    plane_mesh.materials.append(bpy.data.materials["Slides"])
 
     for i, svg_file in enumerate(svg_files):
-        # add a plane as a background for the text
-        create_plane = bpy.ops.mesh.primitive_plane_add(
-            size=1, enter_editmode=True, align="WORLD"
-        )
-        bpy.ops.transform.resize(value=(2, 1, 1))
-        bpy.ops.transform.translate(value=(0, 2.8, 0))
-        bpy.ops.object.editmode_toggle()
-        plane = bpy.context.active_object
-        plane.data.materials.append(bpy.data.materials["Slides"])
+        existing_ids = {obj.as_pointer() for obj in bpy.data.objects}
 
-        # name the plane Slide i
-        plane.name = f"Slide {i}"
-
-        # apply scale
+        # add a plane as a background for the text, named Slide i
+        plane = bpy.data.objects.new(f"Slide {i}", plane_mesh.copy())
+        bpy.context.collection.objects.link(plane)
 
         # Import SVG
         bpy.ops.import_curve.svg(filepath=svg_file)
-        new_objects = []
-
-        # print(f"Existing objects: {existing_objects}")
-
-        for obj in bpy.data.objects:
-            if obj not in existing_objects:
-                new_objects.append(obj)
-                existing_objects.append(obj)
+        new_objects = [
+            obj for obj in bpy.data.objects if obj.as_pointer() not in existing_ids
+        ]
+
+        # join the slide's glyph curves into one object so a single Solidify
+        # modifier is evaluated per slide instead of one per glyph
+        glyphs = [obj for obj in new_objects if obj.type == "CURVE"]
+        if len(glyphs) > 1:
+            new_objects = [obj for obj in new_objects if obj.type != "CURVE"]
+            new_objects.append(glyphs[0])
+            with bpy.context.temp_override(
+                active_object=glyphs[0],
+                selected_objects=glyphs,
+                selected_editable_objects=glyphs,
+            ):
+                bpy.ops.object.join()
 
         # print(f"New objects: {new_objects}")
 
@@ -519,21 +661,58 @@ def import_and_transform_svgs(svg_files, offset_x=3):
             else:
                 obj.location.x = i * offset_x
                 obj.modifiers["Solidify"].thickness = 0.02
-            original_camera_y_location = bpy.context.scene.camera.location.y
-            # insert keyframe in camera for location
-            target_frame = (i * 30) + 1
 
-            bpy.context.scene.camera.location.y = original_camera_y_location - 2
-            bpy.context.scene.camera.keyframe_insert(
-                data_path="location", index=1, frame=target_frame - 15
+    bpy.data.meshes.remove(plane_mesh)
+    animate_camera(len(svg_files), offset_x)
+    bpy.context.view_layer.update()
+
+
+def animate_camera(slide_count, offset_x=3):
+    """Keyframe the camera moving from slide to slide.
+
+    Each slide gets a keyframe at frame 30 * i + 1 centered on the slide, with the
+    camera pulled back 2 units in Y 15 frames earlier. All keyframes are written
+    straight into the fcurves rather than through keyframe_insert.
+    """
+    if not slide_count:
+        return
+    camera = bpy.context.scene.camera
+    x, y, z = camera.location
+    target_frames = [float(i * 30 + 1) for i in range(slide_count)]
+
+    keys = [
+        # x: centered on each slide
+        [(frame, offset_x * i) for i, frame in enumerate(target_frames)],
+        # y: pull back before each slide, then return
+        [
+            key
+            for frame in target_frames
+            for key in ((frame - 15, y - 2), (frame, y))
+        ],
+        # z: unchanged
+        [(frame, z) for frame in target_frames],
+    ]
+
+    camera.animation_data_create()
+    action = bpy.data.actions.new("CamLoc")
+    # the action has to be assigned before its fcurves are created, so that
+    # Blender 4.4+ creates and assigns the slot the camera plays back from
+    camera.animation_data.action = action
+    for axis, axis_keys in enumerate(keys):
+        if hasattr(action, "fcurve_ensure_for_datablock"):
+            fcurve = action.fcurve_ensure_for_datablock(
+                camera, "location", index=axis
             )
+        else:
+            # Blender < 4.4 only has the legacy fcurves API
+            fcurve = action.fcurves.new("location", index=axis)
+        fcurve.keyframe_points.add(len(axis_keys))
+        fcurve.keyframe_points.foreach_set(
+            "co", [value for key in axis_keys for value in key]
+        )
+        fcurve.update()
 
-            bpy.context.scene.camera.location.x = offset_x * i
-            bpy.context.scene.camera.location.y = original_camera_y_location
-
-            bpy.context.scene.camera.keyframe_insert(
-                data_path="location", frame=target_frame
-            )
+    camera.location = (offset_x * (slide_count - 1), y, z)
 
 
 def save_blend_file(filename):
@@ -544,12 +723,6 @@ inkscape = InkscapeInstallerFactory.get_installer()
 
 
 def main(input_md: str):
-    # Determine the OS and create the appropriate installer
-
-    # Check if Inkscape is installed
-    if not inkscape.is_installed():
-        inkscape.install()
-
     base_dir = Path.home() / ".md3d" / "documents"
     base_dir.mkdir(parents=True, exist_ok=True)
 
@@ -566,8 +739,7 @@ def main(input_md: str):
     svg_files = convert_to_svgs(markdown_sections, base_dir)
 
     # remove the default cube
-    for obj in bpy.data.objects:
-        bpy.data.objects.remove(obj, do_unlink=True)
+    bpy.data.batch_remove(list(bpy.data.objects))
 
     # create a material for the slides
     create_material()
@@ -620,6 +792,8 @@ def main(input_md: str):
         base_color=(0.417, 0.445, 0.801, 1.0),
     )
     backdrop.data.materials.append(bpy.data.materials["Backdrop"])
+    # all slide, image and backdrop materials exist now
+    release_material_protos()
 
     bpy.ops.object.mode_set(mode="OBJECT")
 
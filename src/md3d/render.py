@@ -0,0 +1,88 @@
+"""Markdown -> SVG rendering for the slide sections.
+
+This module only depends on PyMuPDF and markdown so it can be imported by
+process pool workers without loading bpy/Blender.
+"""
+from hashlib import blake2b
+
+import fitz  # PyMuPDF
+import markdown
+from markdown.extensions.codehilite import CodeHiliteExtension
+from pygments.formatters import HtmlFormatter
+
+from .utils.fileutils import write_text_atomic
+
+
+class CustomHtmlFormatter(HtmlFormatter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
+# the formatter CSS and markdown extensions are the same for every section
+_FORMATTER = CustomHtmlFormatter(style="default")  # You can change the style as needed
+_CSS = _FORMATTER.get_style_defs(".codehilite")
+_MD_EXTENSIONS = [
+    "fenced_code",
+    # codehilite instantiates the formatter class itself for each code block
+    CodeHiliteExtension(pygments_formatter=CustomHtmlFormatter),
+]
+
+
+def markdown_to_html(md_text):
+    print("Converting Markdown to HTML...")
+    print(md_text)
+    # Convert Markdown to HTML
+    html_content = markdown.markdown(md_text, extensions=_MD_EXTENSIONS)
+
+    # Combine CSS and HTML
+    return f"<html><head><style>{_CSS}</style></head><body>{html_content}</body></html>"
+
+
+# bump when the rendering changes so cached SVGs are regenerated
+RENDER_VERSION = 1
+
+
+def section_digest(section):
+    """Content hash of a markdown section, used to name its cached SVG.
+
+    The renderer version, PyMuPDF version and CSS are hashed along with the
+    section so a change to any of them invalidates the cache.
+    """
+    digest = blake2b(digest_size=12)
+    digest.update(f"{RENDER_VERSION}\0{fitz.VersionBind}\0{_CSS}\0".encode())
+    digest.update(section.encode())
+    return digest.hexdigest()
+
+
+def render_sections(indices, sections, base_dir):
+    """Render sections as pages of one document and export each page to SVG.
+
+    Returns (i, pdf_path) pairs; pdf_path is only set for sections whose SVG
+    still has to go through Inkscape.
+    """
+    doc = fitz.open()
+    for section in sections:
+        page = doc.new_page()
+        rect = fitz.Rect(0, 0, page.rect.width, page.rect.height)
+        page.insert_htmlbox(rect, markdown_to_html(section))
+
+    results = []
+    for i, section, page in zip(indices, sections, doc):
+        digest = section_digest(section)
+        output_svg = base_dir / f"section_{digest}.svg"
+        try:
+            svg_text = page.get_svg_image(matrix=fitz.Identity)
+        except (RuntimeError, ValueError) as e:
+            print(f"Falling back to Inkscape for {output_svg}: {e}")
+            output_pdf = base_dir / f"section_{digest}.pdf"
+            single = fitz.open()
+            single.insert_pdf(doc, from_page=page.number, to_page=page.number)
+            single.save(str(output_pdf))
+            single.close()
+            results.append((i, str(output_pdf)))
+            continue
+        # the cache only checks that the SVG exists, so never leave a partial one
+        write_text_atomic(output_svg, svg_text)
+        results.append((i, None))
+    doc.close()
+    return results
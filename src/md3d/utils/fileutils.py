@@ -0,0 +1,12 @@
+import tempfile
+from pathlib import Path
+
+
+def write_text_atomic(path, text):
+    """Write text to a temporary file next to path, then move it into place."""
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, prefix=path.name + ".", suffix=".part", delete=False
+    ) as f:
+        f.write(text)
+    Path(f.name).replace(path)